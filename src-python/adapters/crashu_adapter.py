@@ -4,6 +4,7 @@ crashu 适配器
 """
 
 import os
+import stat
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
@@ -75,13 +76,16 @@ class CrashuAdapter(BaseAdapter):
         """
         # 验证路径
         source_path = Path(input_data.path)
-        if not source_path.exists():
+        # 单次 stat 同时判断存在性和类型
+        try:
+            is_dir = stat.S_ISDIR(source_path.stat().st_mode)
+        except (FileNotFoundError, NotADirectoryError):
             return CrashuOutput(
                 success=False,
                 message=f"源路径不存在: {input_data.path}"
             )
         
-        if not source_path.is_dir():
+        if not is_dir:
             return CrashuOutput(
                 success=False,
                 message=f"源路径不是目录: {input_data.path}"
@@ -106,20 +110,21 @@ class CrashuAdapter(BaseAdapter):
             target_folder_fullpaths = []
             
             if input_data.target_path and Path(input_data.target_path).exists():
-                # 从目标路径自动获取文件夹名称
-                target_path = Path(input_data.target_path)
-                for item in target_path.iterdir():
-                    if item.is_dir():
-                        target_folder_names.append(item.name)
-                        target_folder_fullpaths.append(str(item))
+                # 从目标路径自动获取文件夹名称（os.scandir 复用目录项中的类型信息，无需逐个 stat）
+                with os.scandir(Path(input_data.target_path)) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            target_folder_names.append(entry.name)
+                            target_folder_fullpaths.append(entry.path)
                 
                 if on_log:
                     on_log(f"从目标路径获取 {len(target_folder_names)} 个文件夹名称")
             else:
                 # 使用源目录中的文件夹作为目标
-                for item in source_path.iterdir():
-                    if item.is_dir():
-                        target_folder_names.append(item.name)
+                with os.scandir(source_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            target_folder_names.append(entry.name)
                 
                 if on_log:
                     on_log(f"使用源目录中的 {len(target_folder_names)} 个文件夹")
@@ -169,7 +169,8 @@ class EngineVAdapter(BaseAdapter):
             if on_log:
                 on_log(f"✅ 扫描完成: {result.count} 个壁纸")
             
-            return EngineVOutput(
+            # 壁纸列表由 to_dict() 生成，结构可信，跳过逐项校验
+            return EngineVOutput.model_construct(
                 success=True,
                 message=f"扫描完成: {result.count} 个壁纸",
                 wallpapers=wallpapers,
@@ -226,7 +227,7 @@ class EngineVAdapter(BaseAdapter):
             if on_log:
                 on_log(f"✅ 过滤完成: {len(filtered)} 个壁纸")
             
-            return EngineVOutput(
+            return EngineVOutput.model_construct(
                 success=True,
                 message=f"过滤完成: {len(filtered)} 个壁纸",
                 wallpapers=wallpapers,
@@ -4,6 +4,7 @@ rawfilter 适配器
 """
 
 import os
+import stat
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
@@ -79,13 +80,16 @@ class RawfilterAdapter(BaseAdapter):
         """
         # 验证路径
         path = Path(input_data.path)
-        if not path.exists():
+        # 单次 stat 同时判断存在性和类型
+        try:
+            is_dir = stat.S_ISDIR(path.stat().st_mode)
+        except (FileNotFoundError, NotADirectoryError):
             return RawfilterOutput(
                 success=False,
                 message=f"路径不存在: {input_data.path}"
             )
         
-        if not path.is_dir():
+        if not is_dir:
             return RawfilterOutput(
                 success=False,
                 message=f"路径不是目录: {input_data.path}"
@@ -102,11 +106,12 @@ class RawfilterAdapter(BaseAdapter):
             if on_progress:
                 on_progress(10, "正在扫描文件...")
             
-            # 扫描压缩包文件
+            # 扫描压缩包文件（os.scandir 复用目录项中的类型信息，无需逐个 stat）
             archive_files = []
-            for file in path.iterdir():
-                if file.is_file() and file.suffix.lower() in ARCHIVE_EXTENSIONS:
-                    archive_files.append(file.name)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in ARCHIVE_EXTENSIONS:
+                        archive_files.append(entry.name)
             
             if not archive_files:
                 return RawfilterOutput(
@@ -9,6 +9,7 @@ repacku 适配器
 
 import io
 import os
+import stat
 import sys
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
@@ -18,27 +19,44 @@ from pydantic import Field
 from .base import BaseAdapter, AdapterInput, AdapterOutput
 
 
+_utf8_configured = False
+
+
+def _reconfigure_utf8(stream):
+    """
+    将输出流切换为 UTF-8 编码，忽略无法编码的字符，并启用行缓冲
+    
+    优先使用 reconfigure() 原地切换，避免重新包装 buffer 丢失已缓冲的输出；
+    不支持 reconfigure 的流才退回到 TextIOWrapper 包装。
+    作为子进程运行时 stdout 是管道，需显式开启行缓冲，日志才能及时送达父进程。
+    """
+    if hasattr(stream, 'reconfigure'):
+        stream.reconfigure(encoding='utf-8', errors='replace', line_buffering=True)
+        return stream
+    if hasattr(stream, 'buffer'):
+        return io.TextIOWrapper(
+            stream.buffer,
+            encoding='utf-8',
+            errors='replace',
+            line_buffering=True
+        )
+    return stream
+
+
 def _ensure_utf8_output():
     """确保 stdout/stderr 使用 UTF-8 编码，避免 Windows GBK 编码问题"""
-    if sys.platform == 'win32':
-        # 设置环境变量强制 Python 使用 UTF-8
-        os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
-        
-        # 重新包装 stdout/stderr 使用 UTF-8 编码，忽略无法编码的字符
-        if hasattr(sys.stdout, 'buffer'):
-            sys.stdout = io.TextIOWrapper(
-                sys.stdout.buffer, 
-                encoding='utf-8', 
-                errors='replace',
-                line_buffering=True
-            )
-        if hasattr(sys.stderr, 'buffer'):
-            sys.stderr = io.TextIOWrapper(
-                sys.stderr.buffer, 
-                encoding='utf-8', 
-                errors='replace',
-                line_buffering=True
-            )
+    global _utf8_configured
+    
+    # 只在 Windows 上处理，且只处理一次
+    if _utf8_configured or sys.platform != 'win32':
+        return
+    
+    # 设置环境变量强制 Python 使用 UTF-8
+    os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
+    
+    sys.stdout = _reconfigure_utf8(sys.stdout)
+    sys.stderr = _reconfigure_utf8(sys.stderr)
+    _utf8_configured = True
 
 
 # 在模块加载时执行编码适配
@@ -129,13 +147,16 @@ class RepackuAdapter(BaseAdapter):
         """阶段1：分析目录结构"""
         path = Path(input_data.path)
         
-        if not path.exists():
+        # 单次 stat 同时判断存在性和类型
+        try:
+            is_dir = stat.S_ISDIR(path.stat().st_mode)
+        except (FileNotFoundError, NotADirectoryError):
             return RepackuOutput(
                 success=False,
                 message=f"路径不存在: {input_data.path}"
             )
         
-        if not path.is_dir():
+        if not is_dir:
             return RepackuOutput(
                 success=False,
                 message=f"路径不是目录: {input_data.path}"
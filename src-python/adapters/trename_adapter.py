@@ -10,6 +10,7 @@ trename 适配器
 5. undo: 撤销操作
 """
 
+import asyncio
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
@@ -32,6 +33,7 @@ class TrenameInput(AdapterInput):
     compact: bool = Field(default=True, description="紧凑格式（推荐）")
     # import/rename 参数
     json_content: str = Field(default="", description="JSON 内容（翻译后的）")
+    json_path: str = Field(default="", description="JSON 文件路径（大文件时代替 json_content，二者只能指定一个）")
     base_path: str = Field(default="", description="基础路径")
     dry_run: bool = Field(default=False, description="只模拟执行")
     # undo 参数
@@ -74,7 +76,7 @@ class TrenameAdapter(BaseAdapter):
         from trename.scanner import FileScanner, split_json
         from trename.renamer import FileRenamer
         from trename.undo import UndoManager
-        from trename.models import RenameJSON, count_total, count_ready, count_pending
+        from trename.models import RenameJSON
         from trename.validator import ConflictValidator
         
         return {
@@ -83,12 +85,29 @@ class TrenameAdapter(BaseAdapter):
             'FileRenamer': FileRenamer,
             'UndoManager': UndoManager,
             'RenameJSON': RenameJSON,
-            'count_total': count_total,
-            'count_ready': count_ready,
-            'count_pending': count_pending,
             'ConflictValidator': ConflictValidator,
         }
     
+    def _create_scanner(self, include_hidden: bool, exclude_exts: str):
+        """
+        创建 FileScanner 实例
+        
+        扫描器可能持有扫描状态，不在请求和线程之间共享
+        """
+        FileScanner = self.get_module()['FileScanner']
+        
+        # 解析排除扩展名
+        exclude_ext_set = {
+            ext.strip() if ext.strip().startswith(".") else f".{ext.strip()}"
+            for ext in exclude_exts.split(",")
+            if ext.strip()
+        }
+        
+        return FileScanner(
+            ignore_hidden=not include_hidden,
+            exclude_exts=exclude_ext_set,
+        )
+    
     async def execute(
         self,
         input_data: TrenameInput,
@@ -129,73 +148,79 @@ class TrenameAdapter(BaseAdapter):
         
         try:
             module = self.get_module()
-            FileScanner = module['FileScanner']
             split_json = module['split_json']
             RenameJSON = module['RenameJSON']
-            count_total = module['count_total']
-            count_pending = module['count_pending']
-            count_ready = module['count_ready']
             
             if on_log:
                 on_log(f"开始扫描 {len(input_data.paths)} 个目录")
             if on_progress:
                 on_progress(10, "正在初始化扫描器...")
             
-            # 解析排除扩展名
-            exclude_exts = set()
-            if input_data.exclude_exts:
-                exclude_exts = {
-                    ext.strip() if ext.strip().startswith(".") else f".{ext.strip()}"
-                    for ext in input_data.exclude_exts.split(",")
-                    if ext.strip()
-                }
-            
-            scanner = FileScanner(
-                ignore_hidden=not input_data.include_hidden,
-                exclude_exts=exclude_exts,
-            )
-            
-            # 扫描所有目录
-            rename_json = RenameJSON(root=[])
-            base_path = None
-            
-            for i, path_str in enumerate(input_data.paths):
+            # 过滤不存在的路径
+            scan_paths = []
+            for path_str in input_data.paths:
                 path = Path(path_str)
                 if not path.exists():
                     if on_log:
                         on_log(f"⚠️ 路径不存在: {path_str}")
                     continue
+                scan_paths.append(path)
+            
+            # 记录基础路径（第一个目录的父目录）
+            base_path = scan_paths[0].parent if scan_paths else None
+            
+            # 各目录的遍历互不依赖，放到线程中并发扫描，耗时取决于最慢的目录；
+            # 每个目录使用独立的扫描器，线程之间不共享扫描状态
+            scanners = [
+                self._create_scanner(input_data.include_hidden, input_data.exclude_exts)
+                for _ in scan_paths
+            ] or [self._create_scanner(input_data.include_hidden, input_data.exclude_exts)]
+            done = 0
+            
+            async def scan_one(path: Path, scanner):
+                nonlocal done
+                # 使用 scan_as_single_dir 保留目录结构
+                result = await asyncio.to_thread(scanner.scan_as_single_dir, path)
+                done += 1
                 
                 if on_progress:
-                    progress = 10 + int(60 * (i + 1) / len(input_data.paths))
+                    progress = 10 + int(60 * done / len(scan_paths))
                     on_progress(progress, f"扫描: {path.name}")
+                if on_log:
+                    on_log(f"✓ 扫描: {path} ({self._count_nodes(result)['total']} 项)")
                 
-                # 使用 scan_as_single_dir 保留目录结构
-                result = scanner.scan_as_single_dir(path)
+                return result
+            
+            # 等待所有目录扫描结束后再处理失败，避免返回后仍有扫描在输出日志
+            results = await asyncio.gather(
+                *(scan_one(path, scanner) for path, scanner in zip(scan_paths, scanners)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            
+            # 按输入顺序合并结果
+            rename_json = RenameJSON(root=[])
+            for result in results:
                 rename_json.root.extend(result.root)
-                
-                # 记录基础路径（第一个目录的父目录）
-                if base_path is None:
-                    base_path = path.parent
-                
-                if on_log:
-                    on_log(f"✓ 扫描: {path} ({count_total(result)} 项)")
             
-            total = count_total(rename_json)
-            pending = count_pending(rename_json)
-            ready = count_ready(rename_json)
+            counts = self._count_nodes(rename_json)
+            total, pending, ready = counts['total'], counts['pending'], counts['ready']
             
             if on_progress:
                 on_progress(80, "生成 JSON...")
             
-            # 分段处理
-            segments = []
-            seg_list = split_json(rename_json, max_lines=input_data.max_lines)
-            for seg in seg_list:
-                if input_data.compact:
-                    segments.append(scanner.to_compact_json(seg))
-                else:
-                    segments.append(scanner.to_json(seg))
+            # 分段并序列化（大目录树耗时明显，放到线程中执行，避免阻塞事件循环）；
+            # 此时扫描线程都已结束，复用第一个扫描器
+            segments = await asyncio.to_thread(
+                self._build_segments,
+                split_json,
+                scanners[0],
+                rename_json,
+                input_data.max_lines,
+                input_data.compact,
+            )
             
             if on_progress:
                 on_progress(100, "扫描完成")
@@ -236,6 +261,35 @@ class TrenameAdapter(BaseAdapter):
                 message=f"扫描失败: {type(e).__name__}: {str(e)}"
             )
     
+    @staticmethod
+    def _build_segments(split_json, scanner, rename_json, max_lines: int, compact: bool) -> List[str]:
+        """按行数分段并逐段序列化为 JSON 字符串"""
+        to_json = scanner.to_compact_json if compact else scanner.to_json
+        return [to_json(seg) for seg in split_json(rename_json, max_lines=max_lines)]
+    
+    def _json_source_error(self, input_data: TrenameInput) -> Optional[str]:
+        """检查 JSON 来源，json_content 与 json_path 必须且只能指定一个"""
+        if input_data.json_content and input_data.json_path:
+            return "json_content 和 json_path 只能指定一个"
+        if not input_data.json_content and not input_data.json_path:
+            return "请提供 JSON 内容"
+        return None
+    
+    async def _load_rename_json(self, RenameJSON, input_data: TrenameInput):
+        """
+        解析重命名 JSON
+        
+        指定 json_path 时直接读取文件字节交给 pydantic 解析，
+        大型重命名计划无需经请求体传输，也省去一次 str 编码；
+        读取和解析放到线程中执行，避免阻塞事件循环
+        """
+        if input_data.json_path:
+            path = Path(input_data.json_path)
+            return await asyncio.to_thread(
+                lambda: RenameJSON.model_validate_json(path.read_bytes())
+            )
+        return await asyncio.to_thread(RenameJSON.model_validate_json, input_data.json_content)
+    
     async def _import_json(
         self,
         input_data: TrenameInput,
@@ -243,18 +297,16 @@ class TrenameAdapter(BaseAdapter):
         on_log: Optional[Callable[[str], None]] = None
     ) -> TrenameOutput:
         """导入翻译后的 JSON"""
-        if not input_data.json_content:
+        error = self._json_source_error(input_data)
+        if error:
             return TrenameOutput(
                 success=False,
-                message="请提供 JSON 内容"
+                message=error
             )
         
         try:
             module = self.get_module()
             RenameJSON = module['RenameJSON']
-            count_total = module['count_total']
-            count_ready = module['count_ready']
-            count_pending = module['count_pending']
             
             if on_log:
                 on_log("解析 JSON...")
@@ -262,11 +314,10 @@ class TrenameAdapter(BaseAdapter):
                 on_progress(30, "解析 JSON...")
             
             # 解析 JSON
-            rename_json = RenameJSON.model_validate_json(input_data.json_content)
+            rename_json = await self._load_rename_json(RenameJSON, input_data)
             
-            total = count_total(rename_json)
-            ready = count_ready(rename_json)
-            pending = count_pending(rename_json)
+            counts = self._count_nodes(rename_json)
+            total, ready, pending = counts['total'], counts['ready'], counts['pending']
             
             if on_progress:
                 on_progress(100, "导入完成")
@@ -278,10 +329,12 @@ class TrenameAdapter(BaseAdapter):
                 success=True,
                 message=f"导入成功: {total} 项，可重命名 {ready} 项",
                 json_content=input_data.json_content,
+                output_path=input_data.json_path or None,
                 total_items=total,
                 ready_count=ready,
                 pending_count=pending,
                 data={
+                    'json_path': input_data.json_path,
                     'total_items': total,
                     'ready_count': ready,
                     'pending_count': pending,
@@ -303,31 +356,31 @@ class TrenameAdapter(BaseAdapter):
         on_log: Optional[Callable[[str], None]] = None
     ) -> TrenameOutput:
         """验证 JSON 并检测冲突"""
-        if not input_data.json_content:
+        error = self._json_source_error(input_data)
+        if error:
             return TrenameOutput(
                 success=False,
-                message="请提供 JSON 内容"
+                message=error
             )
         
         try:
             module = self.get_module()
             RenameJSON = module['RenameJSON']
             ConflictValidator = module['ConflictValidator']
-            count_total = module['count_total']
-            count_ready = module['count_ready']
             
             if on_log:
                 on_log("检测冲突...")
             if on_progress:
                 on_progress(30, "检测冲突...")
             
-            rename_json = RenameJSON.model_validate_json(input_data.json_content)
+            rename_json = await self._load_rename_json(RenameJSON, input_data)
             base_path = Path(input_data.base_path) if input_data.base_path else Path.cwd()
             
             validator = ConflictValidator()
             conflicts = validator.validate(rename_json, base_path)
             
             conflict_msgs = [c.message for c in conflicts]
+            counts = self._count_nodes(rename_json)
             
             if on_progress:
                 on_progress(100, "检测完成")
@@ -338,8 +391,8 @@ class TrenameAdapter(BaseAdapter):
                 return TrenameOutput(
                     success=True,
                     message=f"检测到 {len(conflicts)} 个冲突",
-                    total_items=count_total(rename_json),
-                    ready_count=count_ready(rename_json),
+                    total_items=counts['total'],
+                    ready_count=counts['ready'],
                     conflicts=conflict_msgs,
                     data={
                         'conflicts': conflict_msgs,
@@ -351,8 +404,8 @@ class TrenameAdapter(BaseAdapter):
                 return TrenameOutput(
                     success=True,
                     message="没有冲突，可以执行重命名",
-                    total_items=count_total(rename_json),
-                    ready_count=count_ready(rename_json),
+                    total_items=counts['total'],
+                    ready_count=counts['ready'],
                     data={
                         'conflicts': [],
                     }
@@ -373,10 +426,11 @@ class TrenameAdapter(BaseAdapter):
         on_log: Optional[Callable[[str], None]] = None
     ) -> TrenameOutput:
         """执行批量重命名"""
-        if not input_data.json_content:
+        error = self._json_source_error(input_data)
+        if error:
             return TrenameOutput(
                 success=False,
-                message="请提供 JSON 内容"
+                message=error
             )
         
         try:
@@ -384,18 +438,16 @@ class TrenameAdapter(BaseAdapter):
             FileRenamer = module['FileRenamer']
             UndoManager = module['UndoManager']
             RenameJSON = module['RenameJSON']
-            count_total = module['count_total']
-            count_ready = module['count_ready']
             
             if on_log:
                 on_log("开始重命名...")
             if on_progress:
                 on_progress(10, "解析 JSON...")
             
-            rename_json = RenameJSON.model_validate_json(input_data.json_content)
+            rename_json = await self._load_rename_json(RenameJSON, input_data)
             
-            total = count_total(rename_json)
-            ready = count_ready(rename_json)
+            counts = self._count_nodes(rename_json)
+            total, ready = counts['total'], counts['ready']
             
             if on_log:
                 on_log(f"总项目: {total}, 可重命名: {ready}")
@@ -509,3 +561,43 @@ class TrenameAdapter(BaseAdapter):
                 success=False,
                 message=f"撤销失败: {type(e).__name__}: {str(e)}"
             )
+    
+    @staticmethod
+    def _iter_nodes(rename_json):
+        """
+        遍历树中的所有节点（文件和目录）
+        
+        使用显式栈代替递归，深层目录树不会触发 RecursionError
+        """
+        stack = list(rename_json.root)
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            children = getattr(node, 'children', None)
+            if children:
+                extend(children)
+    
+    def _count_nodes(self, rename_json) -> Dict[str, int]:
+        """
+        一次遍历同时统计总数、可重命名数和待翻译数
+        
+        节点状态与前端一致：tgt 为空为待翻译，tgt 与 src 不同为可重命名，
+        目录节点使用 src_dir / tgt_dir
+        """
+        total = ready = pending = 0
+        
+        for node in self._iter_nodes(rename_json):
+            total += 1
+            if hasattr(node, 'src_dir'):
+                src, tgt = node.src_dir, node.tgt_dir
+            else:
+                src, tgt = node.src, node.tgt
+            
+            if not tgt:
+                pending += 1
+            elif tgt != src:
+                ready += 1
+        
+        return {'total': total, 'ready': ready, 'pending': pending}
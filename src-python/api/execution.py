@@ -3,8 +3,9 @@
 提供节点和流程的执行功能，支持 WebSocket 实时日志推送
 """
 
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 import asyncio
@@ -15,6 +16,12 @@ from api.websocket import send_log, send_progress, send_status
 
 router = APIRouter(prefix="/execute", tags=["execution"])
 
+# 进度推送的最小间隔（秒），约 20 次/秒，足够界面平滑刷新
+PROGRESS_MIN_INTERVAL = 0.05
+
+# 日志合并推送的间隔（秒）
+LOG_FLUSH_INTERVAL = 0.1
+
 
 # ============ 请求/响应模型 ============
 
@@ -132,6 +139,129 @@ def get_upstream_output(
     return None
 
 
+class ProgressThrottle:
+    """
+    限制进度回调的推送频率
+    
+    适配器可能按文件粒度上报进度，每次上报都会经 WebSocket 推送到前端。
+    距上次推送不足 min_interval 的中间进度先暂存，窗口结束时补发最新的一条，
+    避免耗时步骤前的最后一次进度被丢弃；完成进度（>= 100）总会立即送达。
+    适配器返回后、发送节点状态前须调用 flush()，保证不会有进度晚于状态到达。
+    需在事件循环中调用。
+    """
+    
+    def __init__(
+        self,
+        send: Callable[[int, str], Awaitable[None]],
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._send = send
+        self._min_interval = min_interval
+        self._clock = clock
+        self._last_sent: Optional[float] = None
+        self._pending: Optional[Tuple[int, str]] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def __call__(self, progress: int, message: str):
+        now = self._clock()
+        if (
+            progress >= 100
+            or self._last_sent is None
+            or now - self._last_sent >= self._min_interval
+        ):
+            # 立即送达，之前暂存的进度已过时
+            self._cancel_pending()
+            self._deliver(progress, message)
+            return
+        
+        # 暂存最新进度，窗口结束时补发
+        self._pending = (progress, message)
+        if self._timer is None:
+            delay = self._min_interval - (now - self._last_sent)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+    
+    def _cancel_pending(self):
+        self._pending = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _deliver(self, progress: int, message: str):
+        self._last_sent = self._clock()
+        task = asyncio.create_task(self._send(progress, message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def _on_timer(self):
+        self._timer = None
+        if self._pending is not None:
+            progress, message = self._pending
+            self._pending = None
+            self._deliver(progress, message)
+    
+    async def flush(self):
+        """立即送出暂存的进度，并等待所有进度推送完成"""
+        pending = self._pending
+        self._cancel_pending()
+        if pending is not None:
+            self._deliver(*pending)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class LogCoalescer:
+    """
+    合并日志回调
+    
+    适配器可能按文件粒度输出日志，逐条推送会为每行创建一个任务和一帧 WebSocket 消息。
+    收到日志后最多等待 interval 秒，把期间的所有日志用换行拼接成一条推送；
+    执行结束时调用 flush() 发送剩余日志，并等待定时触发的推送完成。
+    """
+    
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        interval: float = LOG_FLUSH_INTERVAL
+    ):
+        self._send = send
+        self._interval = interval
+        self._lines: List[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # 取出日志和发送在同一把锁内完成，保证批次按顺序送达
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def __call__(self, message: str):
+        self._lines.append(message)
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._interval, self._on_timer)
+    
+    def _on_timer(self):
+        self._timer = None
+        task = asyncio.create_task(self._drain())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _drain(self):
+        async with self._lock:
+            if not self._lines:
+                return
+            batch = "\n".join(self._lines)
+            self._lines.clear()
+            await self._send(batch)
+    
+    async def flush(self):
+        """发送缓冲中的日志，并等待所有已开始的推送完成"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._drain()
+
+
 # ============ API 端点 ============
 
 @router.post("/node", response_model=NodeExecuteResponse)
@@ -167,20 +297,20 @@ async def execute_node(request: NodeExecuteRequest):
         async def on_log(message: str):
             await send_log(task_id, message, node_id)
         
-        # 包装同步回调为异步
-        def sync_on_progress(progress: int, message: str):
-            asyncio.create_task(on_progress(progress, message))
-        
-        def sync_on_log(message: str):
-            asyncio.create_task(on_log(message))
+        # 包装为同步回调（限频 / 合并推送）
+        progress_throttle = ProgressThrottle(on_progress)
+        log_coalescer = LogCoalescer(on_log)
         
         # 执行（带回调）
         result = await safe_execute(
             adapter, 
             input_data,
-            on_progress=sync_on_progress,
-            on_log=sync_on_log
+            on_progress=progress_throttle,
+            on_log=log_coalescer
         )
+        # 送出剩余的进度和日志，保证它们先于完成状态到达
+        await progress_throttle.flush()
+        await log_coalescer.flush()
         
         # 发送完成状态
         status = "completed" if result.success else "error"
@@ -271,19 +401,25 @@ async def execute_flow(request: FlowExecuteRequest):
             input_data = input_class(**config)
             
             # 创建进度和日志回调
-            def sync_on_progress(progress: int, message: str):
-                asyncio.create_task(send_progress(task_id, progress, message, node_id))
+            async def on_progress(progress: int, message: str):
+                await send_progress(task_id, progress, message, node_id)
+            
+            async def on_log(message: str):
+                await send_log(task_id, message, node_id)
             
-            def sync_on_log(message: str):
-                asyncio.create_task(send_log(task_id, message, node_id))
+            progress_throttle = ProgressThrottle(on_progress)
+            log_coalescer = LogCoalescer(on_log)
             
             # 执行（带回调）
             result = await safe_execute(
                 adapter, 
                 input_data,
-                on_progress=sync_on_progress,
-                on_log=sync_on_log
+                on_progress=progress_throttle,
+                on_log=log_coalescer
             )
+            # 送出剩余的进度和日志，保证它们先于节点状态到达
+            await progress_throttle.flush()
+            await log_coalescer.flush()
             
             node_results[node_id] = NodeExecuteResponse(
                 success=result.success,
@@ -3,13 +3,37 @@
 用于在前端显示本地图片等资源
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse, Response
 import mimetypes
+import os
+import stat
 
 router = APIRouter(tags=["files"])
 
+# 预览图文件名（按优先级）
+PREVIEW_NAMES = ("preview.gif", "preview.jpg", "preview.png", "preview.webp")
+
+
+@lru_cache(maxsize=4096)
+def _resolve_preview(wallpaper_dir: str, dir_mtime_ns: int) -> Optional[str]:
+    """
+    查找壁纸目录中的预览图
+    
+    一次 scandir 代替逐个文件名探测；结果按目录修改时间缓存，
+    目录中增删文件会改变 mtime，缓存随之失效
+    """
+    with os.scandir(wallpaper_dir) as it:
+        names = {entry.name.lower(): entry.name for entry in it if entry.is_file()}
+    
+    for name in PREVIEW_NAMES:
+        if name in names:
+            return os.path.join(wallpaper_dir, names[name])
+    return None
+
 
 @router.get("/file")
 async def serve_file(path: str = Query(..., description="本地文件路径")):
@@ -21,10 +45,13 @@ async def serve_file(path: str = Query(..., description="本地文件路径")):
     """
     file_path = Path(path)
     
-    if not file_path.exists():
+    # 单次 stat 同时判断存在性和类型
+    try:
+        st = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise HTTPException(status_code=404, detail=f"文件不存在: {path}")
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=400, detail=f"不是文件: {path}")
     
     # 获取 MIME 类型
@@ -32,10 +59,13 @@ async def serve_file(path: str = Query(..., description="本地文件路径")):
     if mime_type is None:
         mime_type = "application/octet-stream"
     
+    # 复用上面的 stat 结果，FileResponse 不再重复 stat，
+    # 并据此生成 ETag / Last-Modified，支持 webview 缓存协商
     return FileResponse(
         path=file_path,
         media_type=mime_type,
-        filename=file_path.name
+        filename=file_path.name,
+        stat_result=st
     )
 
 
@@ -53,16 +83,16 @@ async def get_wallpaper_preview(
     workshop_dir = Path(workshop_path)
     wallpaper_dir = workshop_dir / workshop_id
     
-    if not wallpaper_dir.exists():
+    try:
+        dir_stat = wallpaper_dir.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise HTTPException(status_code=404, detail=f"壁纸目录不存在: {workshop_id}")
     
-    # 尝试查找预览图文件（按优先级）
-    preview_names = ["preview.gif", "preview.jpg", "preview.png", "preview.webp"]
-    
-    for name in preview_names:
-        preview_path = wallpaper_dir / name
-        if preview_path.exists():
-            mime_type, _ = mimetypes.guess_type(str(preview_path))
+    # 查找预览图文件（按优先级），目录未变化时直接命中缓存
+    if stat.S_ISDIR(dir_stat.st_mode):
+        preview_path = _resolve_preview(str(wallpaper_dir), dir_stat.st_mtime_ns)
+        if preview_path:
+            mime_type, _ = mimetypes.guess_type(preview_path)
             return FileResponse(
                 path=preview_path,
                 media_type=mime_type or "image/gif"
@@ -53,7 +53,7 @@ class ConnectionManager:
             for ws in self.connections[task_id]:
                 try:
                     await ws.send_json(message)
-                except:
+                except Exception:
                     dead.append(ws)
             for ws in dead:
                 self.connections[task_id].discard(ws)
@@ -70,7 +70,7 @@ class TerminalCapture:
                         "type": "output",
                         "text": text
                     })
-                except:
+                except Exception:
                     pass
     
     def disconnect(self, websocket: WebSocket):
@@ -107,7 +107,7 @@ class TerminalCapture:
                     "text": text,
                     "stream": stream
                 })
-            except:
+            except Exception:
                 dead_connections.add(ws)
         
         # 清理断开的连接
@@ -156,7 +156,7 @@ async def list_tool_presets(tool_name: str):
                 preset = json.load(f)
                 if preset.get("tool_name") == tool_name:
                     presets.append(preset)
-        except:
+        except Exception:
             pass
     return presets
 
@@ -143,37 +143,43 @@ class StatusMessage(BaseModel):
 
 # ============ 辅助函数 ============
 
+# 以下辅助函数直接构造消息字典（字段与对应的消息模型一致），
+# 避免每条日志/进度都实例化并校验一次 Pydantic 模型
+
 async def send_log(task_id: str, message: str, node_id: str = None, level: str = "info"):
-    """发送日志消息"""
-    log = LogMessage(
-        task_id=task_id,
-        node_id=node_id,
-        level=level,
-        message=message
-    )
-    await manager.send_to_task(task_id, log.model_dump())
+    """发送日志消息（格式同 LogMessage）"""
+    await manager.send_to_task(task_id, {
+        "type": "log",
+        "task_id": task_id,
+        "node_id": node_id,
+        "level": level,
+        "message": message,
+        "timestamp": datetime.now().isoformat(),
+    })
 
 
 async def send_progress(task_id: str, progress: int, message: str, node_id: str = None):
-    """发送进度消息"""
-    msg = ProgressMessage(
-        task_id=task_id,
-        node_id=node_id,
-        progress=progress,
-        message=message
-    )
-    await manager.send_to_task(task_id, msg.model_dump())
+    """发送进度消息（格式同 ProgressMessage）"""
+    await manager.send_to_task(task_id, {
+        "type": "progress",
+        "task_id": task_id,
+        "node_id": node_id,
+        "progress": progress,
+        "message": message,
+        "timestamp": datetime.now().isoformat(),
+    })
 
 
 async def send_status(task_id: str, status: str, message: str = "", node_id: str = None):
-    """发送状态消息"""
-    msg = StatusMessage(
-        task_id=task_id,
-        node_id=node_id,
-        status=status,
-        message=message
-    )
-    await manager.send_to_task(task_id, msg.model_dump())
+    """发送状态消息（格式同 StatusMessage）"""
+    await manager.send_to_task(task_id, {
+        "type": "status",
+        "task_id": task_id,
+        "node_id": node_id,
+        "status": status,
+        "message": message,
+        "timestamp": datetime.now().isoformat(),
+    })
 
 
 # ============ WebSocket 端点 ============
@@ -0,0 +1,51 @@
+"""
+单元测试：适配器路径检查
+**Feature: adapter-path-checks, Property 1: stat 错误分类**
+
+测试 crashu / rawfilter / repacku 的路径检查：
+- 路径不存在时返回“路径不存在”
+- 其他 stat 错误（如权限不足）交给 safe_execute 处理，不会被误报为路径不存在
+"""
+
+import asyncio
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import safe_execute
+from adapters.crashu_adapter import CrashuAdapter, CrashuInput
+from adapters.rawfilter_adapter import RawfilterAdapter, RawfilterInput
+from adapters.repacku_adapter import RepackuAdapter, RepackuInput
+
+
+ADAPTERS = [
+    (CrashuAdapter, CrashuInput, {}),
+    (RawfilterAdapter, RawfilterInput, {}),
+    (RepackuAdapter, RepackuInput, {"action": "analyze"}),
+]
+
+
+@pytest.mark.parametrize("adapter_class,input_class,extra", ADAPTERS)
+def test_missing_path(adapter_class, input_class, extra, tmp_path):
+    input_data = input_class(path=str(tmp_path / "missing"), **extra)
+
+    result = asyncio.run(safe_execute(adapter_class(), input_data))
+
+    assert not result.success
+    assert "不存在" in result.message
+
+
+@pytest.mark.parametrize("adapter_class,input_class,extra", ADAPTERS)
+def test_permission_error_is_not_reported_as_missing(adapter_class, input_class, extra, tmp_path, monkeypatch):
+    def deny(self, *args, **kwargs):
+        raise PermissionError(13, "Permission denied", str(self))
+
+    monkeypatch.setattr(Path, "stat", deny)
+    input_data = input_class(path=str(tmp_path), **extra)
+
+    result = asyncio.run(safe_execute(adapter_class(), input_data))
+
+    assert not result.success
+    assert result.message.startswith("权限不足")
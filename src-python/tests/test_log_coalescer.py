@@ -0,0 +1,98 @@
+"""
+单元测试：日志合并推送
+**Feature: execution-callbacks, Property 3: 日志合并推送**
+
+测试 LogCoalescer 的行为：
+- 同一间隔内的日志合并为一条，按顺序用换行拼接
+- flush() 立即发送剩余日志，不会重复发送
+- flush() 等待定时触发、尚未完成的推送
+"""
+
+import asyncio
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.execution import LogCoalescer
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    """轮询等待条件成立，超时则失败"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "等待超时"
+        await asyncio.sleep(0.001)
+
+
+def test_burst_is_sent_as_one_batch_on_flush():
+    """大量日志在 flush 时合并为一条推送"""
+    sent = []
+
+    async def send(message: str):
+        sent.append(message)
+
+    async def run():
+        coalescer = LogCoalescer(send, interval=10)
+        for i in range(1000):
+            coalescer(f"line {i}")
+        await coalescer.flush()
+        await coalescer.flush()
+
+    asyncio.run(run())
+
+    assert sent == ["\n".join(f"line {i}" for i in range(1000))]
+
+
+def test_pending_lines_are_sent_after_interval():
+    """未调用 flush 时，日志在间隔到期后自动送达"""
+    sent = []
+
+    async def send(message: str):
+        sent.append(message)
+
+    async def run():
+        coalescer = LogCoalescer(send, interval=0.001)
+        coalescer("a")
+        coalescer("b")
+        await wait_until(lambda: len(sent) == 1)
+        coalescer("c")
+        await wait_until(lambda: len(sent) == 2)
+
+    asyncio.run(run())
+
+    assert sent == ["a\nb", "c"]
+
+
+def test_flush_waits_for_timer_batch_in_flight():
+    """定时触发的推送正在进行时，flush() 要等它完成，后续状态不会抢先送达"""
+    events = []
+    started = []
+    release = None
+
+    async def send(message: str):
+        started.append(message)
+        await release.wait()
+        events.append(("log", message))
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        coalescer = LogCoalescer(send, interval=0.001)
+        coalescer("a")
+        # 等定时器取出日志并进入发送
+        await wait_until(lambda: started == ["a"])
+
+        flush_task = asyncio.create_task(coalescer.flush())
+        await asyncio.sleep(0.01)
+        assert not flush_task.done()
+
+        release.set()
+        await flush_task
+        events.append(("status", "completed"))
+
+    asyncio.run(run())
+
+    assert events == [("log", "a"), ("status", "completed")]
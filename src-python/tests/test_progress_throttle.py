@@ -0,0 +1,201 @@
+"""
+属性测试：进度回调限频
+**Feature: execution-callbacks, Property 1: 进度推送限频**
+
+测试 ProgressThrottle 的行为：
+- 首次进度和完成进度（100）总会送达
+- 两次立即送达的中间进度间隔不小于最小间隔
+- 窗口内被暂存的最新进度会在窗口结束时补发
+- flush() 之后不会再有进度推送，节点状态总在进度之后到达
+"""
+
+import asyncio
+import pytest
+from hypothesis import given, strategies as st, settings
+from typing import List, Tuple
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import api.execution as execution
+from api.execution import ProgressThrottle, NodeExecuteRequest
+from adapters import AdapterInput, AdapterOutput
+
+
+class FakeClock:
+    """可手动推进的单调时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    """轮询等待条件成立，超时则失败"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "等待超时"
+        await asyncio.sleep(0.001)
+
+
+# 每次上报前时钟推进的步长（秒）
+step_strategy = st.lists(
+    st.floats(min_value=0.0, max_value=0.2, allow_nan=False, allow_infinity=False),
+    min_size=1,
+    max_size=200
+)
+
+
+@given(step_strategy)
+@settings(max_examples=50, deadline=None)
+def test_throttle_respects_interval_and_delivers_completion(steps: List[float]):
+    """
+    **Feature: execution-callbacks, Property 1: 进度推送限频**
+
+    对于任意上报时间序列，送达的中间进度间隔不小于最小间隔，且完成进度必定送达
+    """
+    clock = FakeClock()
+    sent: List[Tuple[float, int]] = []
+
+    def send(progress: int, message: str):
+        # 在送达时刻记录时钟，推送本身不需要做任何事
+        sent.append((clock.now, progress))
+        return asyncio.sleep(0)
+
+    async def run():
+        throttle = ProgressThrottle(send, min_interval=0.05, clock=clock.monotonic)
+        for i, step in enumerate(steps):
+            clock.now += step
+            throttle(min(99, i), f"item {i}")
+        clock.now += steps[-1]
+        throttle(100, "完成")
+        await throttle.flush()
+
+    asyncio.run(run())
+
+    # 首次进度和完成进度都必须送达
+    assert sent[0][1] == 0
+    assert sent[-1][1] == 100
+
+    intermediate = [t for t, p in sent if p < 100]
+    for prev, cur in zip(intermediate, intermediate[1:]):
+        assert cur - prev >= 0.05
+
+
+def test_burst_is_collapsed():
+    """同一时刻的大量进度上报只送达第一条和完成进度"""
+    clock = FakeClock()
+    sent = []
+
+    async def send(progress: int, message: str):
+        sent.append(progress)
+
+    async def run():
+        throttle = ProgressThrottle(send, clock=clock.monotonic)
+        for i in range(1000):
+            throttle(i // 10, f"file {i}")
+        throttle(100, "完成")
+        await throttle.flush()
+
+    asyncio.run(run())
+
+    assert sent == [0, 100]
+
+
+def test_latest_dropped_update_is_delivered_when_window_closes():
+    """耗时步骤前的最后一次进度不会丢失"""
+    clock = FakeClock()
+    sent = []
+
+    async def send(progress: int, message: str):
+        sent.append((progress, message))
+
+    async def run():
+        throttle = ProgressThrottle(send, min_interval=0.01, clock=clock.monotonic)
+        throttle(70, "扫描: a")
+        throttle(75, "扫描: b")
+        throttle(80, "生成 JSON...")
+        await wait_until(lambda: len(sent) == 2)
+
+    asyncio.run(run())
+
+    assert sent == [(70, "扫描: a"), (80, "生成 JSON...")]
+
+
+def test_flush_delivers_pending_update_and_waits_for_sends():
+    """flush() 立即送出暂存进度，并等待推送完成"""
+    clock = FakeClock()
+    sent = []
+
+    async def send(progress: int, message: str):
+        await asyncio.sleep(0.001)
+        sent.append(progress)
+
+    async def run():
+        throttle = ProgressThrottle(send, clock=clock.monotonic)
+        throttle(10, "a")
+        throttle(40, "b")
+        await throttle.flush()
+        assert sent == [10, 40]
+        # 窗口定时器已取消，之后不会再有推送
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert sent == [10, 40]
+
+
+class FailingAdapter:
+    """上报两次进度后失败的适配器"""
+
+    name = "failing"
+    display_name = "失败节点"
+    input_schema = AdapterInput
+
+    async def execute(self, input_data, on_progress=None, on_log=None):
+        on_progress(10, "开始")
+        on_progress(40, "处理中")
+        on_log("出错了")
+        return AdapterOutput(success=False, message="失败")
+
+
+def test_no_progress_after_node_status(monkeypatch):
+    """节点状态发出后不会再收到该节点的进度或日志"""
+    events = []
+
+    async def fake_send_progress(task_id, progress, message, node_id=None):
+        # 模拟 WebSocket 发送耗时
+        await asyncio.sleep(0.001)
+        events.append(("progress", progress))
+
+    async def fake_send_log(task_id, message, node_id=None, level="info"):
+        await asyncio.sleep(0.001)
+        events.append(("log", message))
+
+    async def fake_send_status(task_id, status, message="", node_id=None):
+        events.append(("status", status))
+
+    monkeypatch.setattr(execution, "get_adapter", lambda name: FailingAdapter())
+    monkeypatch.setattr(execution, "send_progress", fake_send_progress)
+    monkeypatch.setattr(execution, "send_log", fake_send_log)
+    monkeypatch.setattr(execution, "send_status", fake_send_status)
+
+    async def run():
+        response = await execution.execute_node(
+            NodeExecuteRequest(node_type="failing", config={"path": "x"}, task_id="t")
+        )
+        # 给残留的定时器留出触发时间
+        await asyncio.sleep(0.2)
+        return response
+
+    response = asyncio.run(run())
+
+    assert not response.success
+    assert events[0] == ("status", "running")
+    assert events[-1] == ("status", "error")
+    assert ("progress", 40) in events
+    assert ("log", "出错了") in events
@@ -0,0 +1,133 @@
+"""
+属性测试：trename 节点统计
+**Feature: trename-adapter, Property 1: 单次遍历统计**
+
+测试 TrenameAdapter._count_nodes 的行为：
+- 总数等于树中所有文件和目录节点数
+- 每个节点按前端规则归类为待翻译 / 可重命名 / 无变化
+- 安装了 trename 时，统计结果与 trename.models 的 count_* 函数一致
+"""
+
+import pytest
+from hypothesis import given, strategies as st, settings
+from types import SimpleNamespace
+from typing import List
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.trename_adapter import TrenameAdapter
+
+
+# 名称取自很小的字母表，保证 tgt 与 src 相同的情况经常出现
+name_strategy = st.sampled_from(["", "a", "b", "c"])
+
+file_strategy = st.builds(
+    lambda src, tgt: SimpleNamespace(src=src or "a", tgt=tgt),
+    name_strategy, name_strategy
+)
+
+
+def dir_strategy(children):
+    return st.builds(
+        lambda src, tgt, kids: SimpleNamespace(src_dir=src or "a", tgt_dir=tgt, children=kids),
+        name_strategy, name_strategy, st.lists(children, max_size=4)
+    )
+
+
+tree_strategy = st.lists(
+    st.recursive(file_strategy, dir_strategy, max_leaves=30),
+    max_size=6
+)
+
+
+def flatten(nodes: List) -> List:
+    """朴素递归展开所有节点"""
+    result = []
+    for node in nodes:
+        result.append(node)
+        result.extend(flatten(getattr(node, "children", [])))
+    return result
+
+
+def status(node) -> str:
+    """与前端 getNodeStatus 相同的状态判断"""
+    if hasattr(node, "src_dir"):
+        src, tgt = node.src_dir, node.tgt_dir
+    else:
+        src, tgt = node.src, node.tgt
+    if not tgt:
+        return "pending"
+    if tgt == src:
+        return "same"
+    return "ready"
+
+
+@given(tree_strategy)
+@settings(max_examples=100)
+def test_count_nodes_matches_per_node_status(root: List):
+    """
+    **Feature: trename-adapter, Property 1: 单次遍历统计**
+
+    对于任意文件/目录树，单次遍历覆盖所有节点，且统计结果与逐节点判断状态的结果一致
+    （只验证遍历本身；与 trename 库定义的一致性见 test_count_nodes_matches_trename_library）
+    """
+    counts = TrenameAdapter()._count_nodes(SimpleNamespace(root=root))
+
+    statuses = [status(node) for node in flatten(root)]
+    assert counts["total"] == len(statuses)
+    assert counts["pending"] == statuses.count("pending")
+    assert counts["ready"] == statuses.count("ready")
+
+
+def test_count_nodes_handles_deep_trees():
+    """远超递归深度限制的目录链也能完成统计"""
+    depth = sys.getrecursionlimit() * 2
+    node = SimpleNamespace(src="f", tgt="")
+    for i in range(depth):
+        node = SimpleNamespace(src_dir=f"d{i}", tgt_dir=f"e{i}", children=[node])
+
+    counts = TrenameAdapter()._count_nodes(SimpleNamespace(root=[node]))
+
+    assert counts == {"total": depth + 1, "ready": depth, "pending": 1}
+
+
+# ============ 与 trename 库的一致性 ============
+
+file_dict_strategy = st.builds(
+    lambda src, tgt: {"src": src or "a", "tgt": tgt},
+    name_strategy, name_strategy
+)
+
+
+def dir_dict_strategy(children):
+    return st.builds(
+        lambda src, tgt, kids: {"src_dir": src or "a", "tgt_dir": tgt, "children": kids},
+        name_strategy, name_strategy, st.lists(children, max_size=4)
+    )
+
+
+tree_dict_strategy = st.lists(
+    st.recursive(file_dict_strategy, dir_dict_strategy, max_leaves=30),
+    max_size=6
+)
+
+
+@given(tree_dict_strategy)
+@settings(max_examples=100)
+def test_count_nodes_matches_trename_library(root: List):
+    """
+    **Feature: trename-adapter, Property 1: 单次遍历统计**
+
+    对于任意真实 RenameJSON 树，单次遍历的统计结果与 trename.models 的
+    count_total / count_ready / count_pending 一致
+    """
+    models = pytest.importorskip("trename.models")
+
+    rename_json = models.RenameJSON.model_validate({"root": root})
+    counts = TrenameAdapter()._count_nodes(rename_json)
+
+    assert counts["total"] == models.count_total(rename_json)
+    assert counts["ready"] == models.count_ready(rename_json)
+    assert counts["pending"] == models.count_pending(rename_json)
@@ -0,0 +1,94 @@
+"""
+单元测试：trename 从文件读取重命名 JSON
+**Feature: trename-adapter, Property 2: json_path 输入**
+
+测试 json_path 参数的行为：
+- import / validate 可直接读取 JSON 文件，结果与 json_content 一致
+- import 的结果通过 output_path / data['json_path'] 指向原文件
+- json_content 与 json_path 同时指定或都未指定时拒绝执行
+"""
+
+import asyncio
+import json
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.trename_adapter import TrenameAdapter, TrenameInput
+
+
+PLAN = {
+    "root": [
+        {"src": "a.txt", "tgt": "b.txt"},
+        {"src_dir": "dir", "tgt_dir": "", "children": [
+            {"src": "c.txt", "tgt": "c.txt"},
+        ]},
+    ]
+}
+
+
+@pytest.fixture
+def plan_file(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text(json.dumps(PLAN, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def run(input_data: TrenameInput):
+    return asyncio.run(TrenameAdapter().execute(input_data))
+
+
+@pytest.mark.parametrize("action", ["import", "validate", "rename"])
+def test_rejects_both_sources(action, plan_file):
+    result = run(TrenameInput(
+        action=action,
+        json_content=json.dumps(PLAN),
+        json_path=str(plan_file)
+    ))
+
+    assert not result.success
+    assert "只能指定一个" in result.message
+
+
+@pytest.mark.parametrize("action", ["import", "validate", "rename"])
+def test_rejects_missing_source(action):
+    result = run(TrenameInput(action=action))
+
+    assert not result.success
+    assert result.message == "请提供 JSON 内容"
+
+
+def test_import_from_json_path(plan_file):
+    pytest.importorskip("trename")
+
+    from_file = run(TrenameInput(action="import", json_path=str(plan_file)))
+    from_content = run(TrenameInput(action="import", json_content=json.dumps(PLAN)))
+
+    assert from_file.success, from_file.message
+    assert from_file.total_items == from_content.total_items
+    assert from_file.ready_count == from_content.ready_count
+    assert from_file.pending_count == from_content.pending_count
+    assert from_file.output_path == str(plan_file)
+    assert from_file.data["json_path"] == str(plan_file)
+
+
+def test_validate_from_json_path(plan_file, tmp_path):
+    pytest.importorskip("trename")
+
+    from_file = run(TrenameInput(
+        action="validate",
+        json_path=str(plan_file),
+        base_path=str(tmp_path)
+    ))
+    from_content = run(TrenameInput(
+        action="validate",
+        json_content=json.dumps(PLAN),
+        base_path=str(tmp_path)
+    ))
+
+    assert from_file.success, from_file.message
+    assert from_file.total_items == from_content.total_items
+    assert from_file.ready_count == from_content.ready_count
+    assert from_file.conflicts == from_content.conflicts
@@ -0,0 +1,67 @@
+"""
+单元测试：壁纸预览图查找
+**Feature: file-api, Property 1: 预览图查找**
+
+测试 /preview/{workshop_id} 的行为：
+- 按 gif > jpg > png > webp 的优先级返回预览图
+- 目录内容变化后不会返回过期的缓存结果
+"""
+
+import os
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.files import router
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def _bump_mtime(path: Path, step: int):
+    """显式推进目录修改时间，避免文件系统时间精度导致测试不稳定"""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + step * 1_000_000_000))
+
+
+def test_preview_priority(client, tmp_path):
+    wallpaper_dir = tmp_path / "123"
+    wallpaper_dir.mkdir()
+    (wallpaper_dir / "preview.png").write_bytes(b"png")
+    (wallpaper_dir / "preview.gif").write_bytes(b"gif")
+
+    response = client.get("/preview/123", params={"workshop_path": str(tmp_path)})
+
+    assert response.status_code == 200
+    assert response.content == b"gif"
+
+
+def test_preview_cache_follows_directory_changes(client, tmp_path):
+    wallpaper_dir = tmp_path / "456"
+    wallpaper_dir.mkdir()
+    params = {"workshop_path": str(tmp_path)}
+
+    assert client.get("/preview/456", params=params).status_code == 404
+
+    (wallpaper_dir / "preview.jpg").write_bytes(b"jpg")
+    _bump_mtime(wallpaper_dir, 1)
+    response = client.get("/preview/456", params=params)
+    assert response.status_code == 200
+    assert response.content == b"jpg"
+
+    (wallpaper_dir / "preview.jpg").unlink()
+    _bump_mtime(wallpaper_dir, 2)
+    assert client.get("/preview/456", params=params).status_code == 404
+
+
+def test_missing_wallpaper_dir(client, tmp_path):
+    response = client.get("/preview/789", params={"workshop_path": str(tmp_path)})
+    assert response.status_code == 404
@@ -0,0 +1,65 @@
+"""
+单元测试：WebSocket 消息格式
+**Feature: execution-callbacks, Property 2: 消息格式与模型一致**
+
+send_log / send_progress / send_status 直接构造消息字典，
+测试其字段与 LogMessage / ProgressMessage / StatusMessage 的序列化结果保持一致。
+"""
+
+import asyncio
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import api.websocket as websocket
+from api.websocket import (
+    send_log, send_progress, send_status,
+    LogMessage, ProgressMessage, StatusMessage,
+)
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """捕获发送给任务的消息"""
+    messages = []
+
+    async def fake_send_to_task(task_id, message):
+        messages.append((task_id, message))
+
+    monkeypatch.setattr(websocket.manager, "send_to_task", fake_send_to_task)
+    return messages
+
+
+def _without_timestamp(message: dict) -> dict:
+    return {k: v for k, v in message.items() if k != "timestamp"}
+
+
+def test_send_log_matches_model(sent):
+    asyncio.run(send_log("task-1", "hello", node_id="n1", level="warn"))
+
+    task_id, message = sent[0]
+    expected = LogMessage(task_id="task-1", node_id="n1", level="warn", message="hello").model_dump()
+    assert task_id == "task-1"
+    assert list(message) == list(expected)
+    assert _without_timestamp(message) == _without_timestamp(expected)
+    assert message["timestamp"]
+
+
+def test_send_progress_matches_model(sent):
+    asyncio.run(send_progress("task-2", 42, "扫描中...", node_id="n2"))
+
+    _, message = sent[0]
+    expected = ProgressMessage(task_id="task-2", node_id="n2", progress=42, message="扫描中...").model_dump()
+    assert list(message) == list(expected)
+    assert _without_timestamp(message) == _without_timestamp(expected)
+
+
+def test_send_status_matches_model(sent):
+    asyncio.run(send_status("task-3", "completed"))
+
+    _, message = sent[0]
+    expected = StatusMessage(task_id="task-3", status="completed").model_dump()
+    assert list(message) == list(expected)
+    assert _without_timestamp(message) == _without_timestamp(expected)